@@ -2,21 +2,58 @@
 Advent of Code 2025 - Day 1: Secret Entrance
 """
 
+import os
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+
+
+def iter_rotations(source, chunk_size=1 << 16):
+    """
+    Stream (direction, distance) pairs from a rotation log.
+
+    source can be a file path, an open file such as sys.stdin, or any
+    iterable of byte chunks. Only the current partial line is buffered, so
+    memory stays constant no matter how long the log is.
+    """
+    if isinstance(source, (str, bytes, os.PathLike)):
+        with open(source, 'rb') as f:
+            yield from iter_rotations(f, chunk_size)
+        return
+
+    if hasattr(source, 'read'):
+        # Prefer the underlying binary stream (e.g. sys.stdin.buffer)
+        stream = getattr(source, 'buffer', source)
+        chunks = iter(lambda: stream.read(chunk_size), stream.read(0))
+    else:
+        chunks = source
+
+    pending = b''
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        lines = (pending + chunk).split(b'\n')
+        pending = lines.pop()
+        for line in lines:
+            line = line.strip()
+            if line:
+                yield chr(line[0]), int(line[1:])
+
+    pending = pending.strip()
+    if pending:
+        yield chr(pending[0]), int(pending[1:])
+
 
 def solve_part1(input_file):
     """
     Part 1: Count how many times the dial LANDS on 0 after each rotation.
-    """
-    with open(input_file, 'r') as f:
-        rotations = f.read().strip().split('\n')
 
+    input_file can be anything accepted by iter_rotations.
+    """
     position = 50
     zero_count = 0
 
-    for rotation in rotations:
-        direction = rotation[0]
-        distance = int(rotation[1:])
-
+    for direction, distance in iter_rotations(input_file):
         if direction == 'R':
             position = (position + distance) % 100
         else:
@@ -31,17 +68,13 @@ def solve_part1(input_file):
 def solve_part2(input_file):
     """
     Part 2: Count how many times the dial CROSSES 0 during rotations.
-    """
-    with open(input_file, 'r') as f:
-        rotations = f.read().strip().split('\n')
 
+    input_file can be anything accepted by iter_rotations.
+    """
     position = 50
     zero_count = 0
 
-    for rotation in rotations:
-        direction = rotation[0]
-        distance = int(rotation[1:])
-
+    for direction, distance in iter_rotations(input_file):
         if direction == 'R':
             zero_count += (position + distance) // 100
             position = (position + distance) % 100
@@ -58,12 +91,404 @@ def solve_part2(input_file):
     return zero_count
 
 
+def solve_stream(source):
+    """
+    Solve both parts in a single pass over a rotation stream.
+
+    A pipe like sys.stdin can only be read once, so this keeps both
+    counters side by side. Returns (part1, part2).
+    """
+    position = 50
+    landings = 0
+    crossings = 0
+
+    for direction, distance in iter_rotations(source):
+        if direction == 'R':
+            crossings += (position + distance) // 100
+            position = (position + distance) % 100
+        else:
+            if position == 0:
+                crossings += distance // 100
+            elif distance >= position:
+                crossings += (distance - position) // 100 + 1
+            position = (position - distance) % 100
+
+        if position == 0:
+            landings += 1
+
+    return landings, crossings
+
+
+def build_rotation_index(input_file, dial_size=100, start=50):
+    """
+    Precompute prefix arrays over a rotation log so questions about any
+    span of rotations can be answered without replaying the log.
+
+    Entry k of every array describes the state after the first k rotations
+    (entry 0 is the starting state):
+    - positions[k]: where the dial points
+    - landings[k]:  how many rotations ended on 0 so far (part 1)
+    - crossings[k]: how many clicks landed on 0 so far (part 2)
+    """
+    positions = array('q', [start % dial_size])
+    landings = array('q', [0])
+    crossings = array('q', [0])
+
+    position = start % dial_size
+    landed = 0
+    crossed = 0
+
+    for direction, distance in iter_rotations(input_file):
+        if direction == 'R':
+            crossed += (position + distance) // dial_size
+            position = (position + distance) % dial_size
+        else:
+            if position == 0:
+                crossed += distance // dial_size
+            elif distance >= position:
+                crossed += (distance - position) // dial_size + 1
+            position = (position - distance) % dial_size
+
+        if position == 0:
+            landed += 1
+
+        positions.append(position)
+        landings.append(landed)
+        crossings.append(crossed)
+
+    return {
+        'dial_size': dial_size,
+        'start': start % dial_size,
+        'positions': positions,
+        'landings': landings,
+        'crossings': crossings,
+    }
+
+
+def position_after(index, k):
+    """Where the dial points after the first k rotations. O(1)."""
+    return index['positions'][k]
+
+
+def landings_between(index, i, j):
+    """How many of rotations i..j-1 (0-indexed) ended on 0. O(1)."""
+    return index['landings'][j] - index['landings'][i]
+
+
+def crossings_between(index, i, j):
+    """How many clicks landed on 0 during rotations i..j-1 (0-indexed). O(1)."""
+    return index['crossings'][j] - index['crossings'][i]
+
+
+def rotation_of_nth_crossing(index, n):
+    """
+    Number of rotations needed before the dial has clicked on 0 n times,
+    or None if the log never gets there. O(log n) via bisect.
+    """
+    crossings = index['crossings']
+    k = bisect_left(crossings, n)
+    return k if k < len(crossings) else None
+
+
+def summarize_rotations(rotations):
+    """
+    Reduce a run of rotations to a summary that is independent of where the
+    dial starts.
+
+    Returns (offset, landings, crossings) where offset is the net rotation
+    mod 100 and landings[p] / crossings[p] are the part 1 / part 2 counts
+    for the run when the dial starts at position p.
+
+    Every rotation of distance 100*k + r clicks 0 k times for sure, plus one
+    extra time when the leftover r steps pass 0. With the dial at q before
+    the rotation that happens for q in [100-r, 99] turning R and for q in
+    [1, r] turning L, which is one cyclic interval of start positions, so
+    it is recorded in a difference array.
+    """
+    offset = 0
+    full_turns = 0
+    landings = [0] * 100
+    diff = [0] * 101
+
+    def add_interval(lo, length):
+        # Add 1 to the cyclic interval of start positions [lo, lo+length)
+        if lo + length <= 100:
+            diff[lo] += 1
+            diff[lo + length] -= 1
+        else:
+            diff[lo] += 1
+            diff[100] -= 1
+            diff[0] += 1
+            diff[lo + length - 100] -= 1
+
+    for direction, distance in rotations:
+        turns, rest = divmod(distance, 100)
+        full_turns += turns
+        if rest:
+            if direction == 'R':
+                add_interval((100 - rest - offset) % 100, rest)
+            else:
+                add_interval((1 - offset) % 100, rest)
+
+        if direction == 'R':
+            offset = (offset + distance) % 100
+        else:
+            offset = (offset - distance) % 100
+
+        landings[-offset % 100] += 1
+
+    crossings = []
+    running = full_turns
+    for p in range(100):
+        running += diff[p]
+        crossings.append(running)
+
+    return offset, landings, crossings
+
+
+def combine_summaries(first, second):
+    """
+    Combine the summaries of two adjacent runs (first, then second).
+
+    The second run starts wherever the first one left the dial, so its
+    tables are looked up shifted by the first run's offset.
+    """
+    offset_a, landings_a, crossings_a = first
+    offset_b, landings_b, crossings_b = second
+
+    landings = [landings_a[p] + landings_b[(p + offset_a) % 100] for p in range(100)]
+    crossings = [crossings_a[p] + crossings_b[(p + offset_a) % 100] for p in range(100)]
+    return (offset_a + offset_b) % 100, landings, crossings
+
+
+def split_at_line_boundaries(input_file, n_chunks):
+    """
+    Split a file into about n_chunks byte ranges that start and end on
+    line boundaries. Returns a list of (start, end) offsets.
+    """
+    size = os.path.getsize(input_file)
+    bounds = [0]
+
+    with open(input_file, 'rb') as f:
+        for i in range(1, n_chunks):
+            target = max(size * i // n_chunks, bounds[-1])
+            f.seek(target)
+            f.readline()  # Skip to the start of the next line
+            bounds.append(min(f.tell(), size))
+
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+
+
+def read_byte_range(f, start, end, chunk_size=1 << 16):
+    """Yield the bytes of f between start and end, chunk_size at a time."""
+    f.seek(start)
+    remaining = end - start
+    while remaining > 0:
+        chunk = f.read(min(chunk_size, remaining))
+        if not chunk:
+            break
+        remaining -= len(chunk)
+        yield chunk
+
+
+def summarize_chunk(input_file, start, end):
+    """
+    Worker: stream one byte range of the file and summarize its rotations.
+    Only one read block is held at a time, like iter_rotations.
+    """
+    with open(input_file, 'rb') as f:
+        return summarize_rotations(iter_rotations(read_byte_range(f, start, end)))
+
+
+def solve_parallel(input_file, workers=None):
+    """
+    Solve both parts with a process pool (map-reduce over chunk summaries).
+
+    The file is split at line boundaries, every worker summarizes one chunk,
+    and the summaries are folded in file order before being evaluated at
+    the start position 50. Returns (part1, part2).
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = split_at_line_boundaries(input_file, workers)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        summaries = list(pool.map(
+            summarize_chunk,
+            [input_file] * len(chunks),
+            [start for start, _ in chunks],
+            [end for _, end in chunks],
+        ))
+
+    total = (0, [0] * 100, [0] * 100)
+    for summary in summaries:
+        total = combine_summaries(total, summary)
+
+    _, landings, crossings = total
+    return landings[50], crossings[50]
+
+
+def parse_deltas_block(raw):
+    """
+    Parse one block of whole lines (a uint8 array) into signed int64 deltas.
+
+    R rotations become positive deltas and L rotations negative ones.
+    Everything except L, R and digits (e.g. '\r', spaces, blank lines) is
+    dropped first, so each remaining line is "<dir><digits>". Every digit is
+    then weighted by 10 raised to the number of digits after it in its line,
+    and np.add.reduceat sums the weighted digits per line.
+
+    Raises OverflowError for distances of more than 18 digits, which do not
+    fit in int64.
+    """
+    import numpy as np
+
+    is_digit = (raw >= ord('0')) & (raw <= ord('9'))
+    keep = is_digit | (raw == ord('L')) | (raw == ord('R'))
+    line_of_byte = np.cumsum(raw == ord('\n'), dtype=np.int32)[keep]
+    kept = raw[keep]
+
+    if kept.size == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    # A new line starts wherever the line number changes (blank lines vanish)
+    line_starts = np.flatnonzero(np.concatenate(([True], line_of_byte[1:] != line_of_byte[:-1])))
+    line_lengths = np.diff(line_starts, append=kept.size)
+    if line_lengths.max() > 19:
+        raise OverflowError("rotation distance does not fit in int64")
+
+    # Digits left after each byte in its own line (at most 18)
+    exponent = np.repeat(line_starts + line_lengths, line_lengths) - np.arange(kept.size) - 1
+    powers = np.power(10, np.arange(19), dtype=np.int64)[exponent.astype(np.int8)]
+    weighted = np.where(is_digit[keep], (kept.astype(np.int64) - ord('0')) * powers, 0)
+
+    distances = np.add.reduceat(weighted, line_starts)
+    signs = np.where(kept[line_starts] == ord('R'), 1, -1)
+    return signs * distances
+
+
+def iter_delta_blocks(input_file, block_size=1 << 20):
+    """
+    Stream the rotation file as signed int64 delta arrays, one per block.
+
+    The file is read in blocks of about block_size bytes cut after the last
+    newline, so the scratch arrays of parse_deltas_block stay bounded by the
+    block size however long the log is.
+    """
+    import numpy as np
+
+    with open(input_file, 'rb') as f:
+        pending = b''
+        while True:
+            chunk = f.read(block_size)
+            data = pending + chunk
+            cut = len(data) if not chunk else data.rfind(b'\n') + 1
+            if cut:
+                yield parse_deltas_block(np.frombuffer(data, dtype=np.uint8, count=cut))
+            pending = data[cut:]
+            if not chunk:
+                break
+
+
+def parse_deltas_numpy(input_file, block_size=1 << 20):
+    """Parse the whole rotation file into one signed int64 delta array."""
+    import numpy as np
+
+    blocks = list(iter_delta_blocks(input_file, block_size))
+    return np.concatenate(blocks) if blocks else np.zeros(0, dtype=np.int64)
+
+
+def solve_part1_numpy(input_file):
+    """
+    Part 1 (NumPy engine): positions are the cumulative sum of deltas mod 100.
+
+    Deltas are taken mod 100 before the cumulative sum so it cannot
+    overflow, and the position is carried from one block to the next.
+    Falls back to solve_part1 for distances too large for int64.
+    """
+    import numpy as np
+
+    position = 50
+    zero_count = 0
+    try:
+        for deltas in iter_delta_blocks(input_file):
+            if deltas.size:
+                positions = (position + np.cumsum(deltas % 100)) % 100
+                zero_count += int(np.count_nonzero(positions == 0))
+                position = int(positions[-1])
+    except OverflowError:
+        return solve_part1(input_file)
+
+    return zero_count
+
+
+def solve_part2_numpy(input_file):
+    """
+    Part 2 (NumPy engine): count zero crossings with array floor division.
+
+    A rotation of distance 100*q + r clicks 0 q times plus however many
+    multiples of 100 the last r steps pass. For those, work on the unwrapped
+    dial value S (start + cumulative signed remainders):
+    - R from S to S+r touches the multiples in (S, S+r]
+    - L from S to S-r touches the multiples in [S-r, S)
+    Both counts are differences of floor divisions by 100. The position is
+    carried from one block to the next.
+    Falls back to solve_part2 for distances too large for int64.
+    """
+    import numpy as np
+
+    position = 50
+    zero_count = 0
+    try:
+        for deltas in iter_delta_blocks(input_file):
+            if not deltas.size:
+                continue
+            turns, rest = np.divmod(np.abs(deltas), 100)
+            steps = np.sign(deltas) * rest
+            after = position + np.cumsum(steps)
+            before = after - steps
+
+            crosses = np.where(
+                steps > 0,
+                after // 100 - before // 100,
+                (before - 1) // 100 - (after - 1) // 100,
+            )
+            if int(turns.max()) < (1 << 63) // turns.size:
+                zero_count += int(turns.sum())
+            else:
+                zero_count += sum(turns.tolist())  # Would overflow int64
+            zero_count += int(crosses.sum())
+            position = int(after[-1]) % 100
+    except OverflowError:
+        return solve_part2(input_file)
+
+    return zero_count
+
+
 if __name__ == "__main__":
-    import os
+    import sys
+
     script_dir = os.path.dirname(os.path.abspath(__file__))
     input_file = os.path.join(script_dir, "inputs.txt")
 
     print("Day 1: Secret Entrance")
     print("-" * 30)
+
+    if '-' in sys.argv:
+        # Stream rotations from stdin, e.g. `cat huge.log | python solution.py -`
+        part1, part2 = solve_stream(sys.stdin)
+        print(f"Part 1: {part1}")
+        print(f"Part 2: {part2}")
+        sys.exit(0)
+
     print(f"Part 1: {solve_part1(input_file)}")
     print(f"Part 2: {solve_part2(input_file)}")
+
+    if '--parallel' in sys.argv:
+        part1, part2 = solve_parallel(input_file)
+        print(f"Part 1 (parallel): {part1}")
+        print(f"Part 2 (parallel): {part2}")
+
+    if '--numpy' in sys.argv:
+        print(f"Part 1 (NumPy): {solve_part1_numpy(input_file)}")
+        print(f"Part 2 (NumPy): {solve_part2_numpy(input_file)}")
@@ -11,6 +11,14 @@ Part 2: ID is invalid if it consists of a digit sequence repeated at least twice
         Examples: 111 (1 three times), 123123123 (123 three times), 1212121212 (12 five times)
 """
 
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+
 
 def is_invalid_id_part1(n):
     """
@@ -59,6 +67,90 @@ def is_invalid_id_part2(n):
     return False
 
 
+def _prime_factors(n):
+    """Distinct prime factors of n."""
+    factors = []
+    factor = 2
+    while factor * factor <= n:
+        if n % factor == 0:
+            factors.append(factor)
+            while n % factor == 0:
+                n //= factor
+        factor += 1
+    if n > 1:
+        factors.append(n)
+    return factors
+
+
+def _digit_lengths(ids):
+    """Digit count of every uint64 in ids, by bisecting against powers of ten."""
+    import numpy as np
+
+    powers = np.array([10 ** e for e in range(20)], dtype=np.uint64)
+    return np.searchsorted(powers, ids, side='right')
+
+
+def _as_uint64_array(ids):
+    """View a NumPy array or array('Q') as a uint64 ndarray without copying."""
+    import numpy as np
+
+    if isinstance(ids, np.ndarray):
+        return ids.astype(np.uint64, copy=False)
+    return np.frombuffer(ids, dtype=np.uint64)
+
+
+def is_invalid_id_part1_batch(ids):
+    """
+    Part 1 over a whole array: boolean mask of IDs that are a pattern
+    repeated exactly twice.
+
+    An L-digit ID is a doubled h-digit pattern exactly when L = 2h and the
+    ID is divisible by 10^h + 1 (the quotient is then the pattern, and it
+    always has h digits), so no strings are built.
+    """
+    import numpy as np
+
+    ids = _as_uint64_array(ids)
+    lengths = _digit_lengths(ids)
+
+    # Per digit count: the multiplier to test, or 0 if no pattern fits
+    multipliers = np.zeros(21, dtype=np.uint64)
+    for total_digits in range(2, 21, 2):
+        multipliers[total_digits] = 10 ** (total_digits // 2) + 1
+
+    m = multipliers[lengths]
+    return (m != 0) & (ids % np.maximum(m, 1) == 0)
+
+
+def is_invalid_id_part2_batch(ids):
+    """
+    Part 2 over a whole array: boolean mask of IDs that are a pattern
+    repeated at least twice.
+
+    An L-digit ID repeats with some proper period iff it repeats with period
+    L/q for a prime q dividing L, i.e. iff it is divisible by the repunit
+    multiplier (10^L - 1) / (10^(L/q) - 1). Up to 20 digits L has at most
+    two distinct prime factors, so each ID needs at most two modulo tests.
+    """
+    import numpy as np
+
+    ids = _as_uint64_array(ids)
+    lengths = _digit_lengths(ids)
+
+    first = np.zeros(21, dtype=np.uint64)
+    second = np.zeros(21, dtype=np.uint64)
+    for total_digits in range(2, 21):
+        primes = _prime_factors(total_digits)
+        tests = [(10 ** total_digits - 1) // (10 ** (total_digits // q) - 1) for q in primes]
+        first[total_digits] = tests[0]
+        second[total_digits] = tests[-1]
+
+    m1 = first[lengths]
+    m2 = second[lengths]
+    divisible = (ids % np.maximum(m1, 1) == 0) | (ids % np.maximum(m2, 1) == 0)
+    return (m1 != 0) & divisible
+
+
 def find_invalid_ids_in_range_part1(start, end):
     """
     Part 1: Find all invalid IDs (pattern repeated exactly twice) in range.
@@ -167,8 +259,308 @@ def solve_part2(input_file):
     return sum(all_invalid_ids)
 
 
+def mobius(n):
+    """Möbius function mu(n) by trial division (n is a digit count, so tiny)."""
+    result = 1
+    factor = 2
+    while factor * factor <= n:
+        if n % factor == 0:
+            n //= factor
+            if n % factor == 0:
+                return 0
+            result = -result
+        factor += 1
+    if n > 1:
+        result = -result
+    return result
+
+
+def sum_repeated_ids(start, end, pattern_len, total_digits):
+    """
+    Sum of all IDs in [start, end] made of a pattern_len-digit pattern
+    repeated to total_digits digits, in closed form.
+
+    Every such ID is pattern * multiplier where the multiplier is the
+    "repunit" 1 0..01 0..01 ... (e.g. 1001001 for 3-digit patterns repeated
+    3 times). So the IDs in range come from one interval of patterns, and
+    their sum is multiplier * (arithmetic series over that interval).
+    """
+    multiplier = (10 ** total_digits - 1) // (10 ** pattern_len - 1)
+
+    # Patterns have exactly pattern_len digits (no leading zeros)
+    lo = max(10 ** (pattern_len - 1), -(-start // multiplier))
+    hi = min(10 ** pattern_len - 1, end // multiplier)
+
+    if lo > hi:
+        return 0
+    return multiplier * (lo + hi) * (hi - lo + 1) // 2
+
+
+def sum_invalid_ids_in_range_part1(start, end):
+    """
+    Part 1 (closed form): sum of IDs in range that are a pattern repeated
+    exactly twice. Only even digit counts qualify.
+    """
+    total = 0
+    for total_digits in range(len(str(start)), len(str(end)) + 1):
+        if total_digits % 2 == 0:
+            total += sum_repeated_ids(start, end, total_digits // 2, total_digits)
+    return total
+
+
+def sum_invalid_ids_in_range_part2(start, end):
+    """
+    Part 2 (closed form): sum of IDs in range that are a pattern repeated
+    at least twice.
+
+    For a fixed digit count L, an ID repeating with period p also repeats
+    with every multiple of p that divides L, so summing over all periods
+    double-counts (1111 is "1" x 4 and "11" x 2). Inclusion-exclusion over
+    the divisors of L fixes that: the union of "has period p" for proper
+    divisors p of L sums to
+
+        -sum over p | L, p < L of mu(L / p) * sum_repeated_ids(p, L)
+    """
+    total = 0
+    for total_digits in range(len(str(start)), len(str(end)) + 1):
+        for pattern_len in range(1, total_digits // 2 + 1):
+            if total_digits % pattern_len != 0:
+                continue
+            weight = -mobius(total_digits // pattern_len)
+            if weight:
+                total += weight * sum_repeated_ids(start, end, pattern_len, total_digits)
+    return total
+
+
+def solve_part1_closed_form(input_file):
+    """
+    Part 1 without enumerating IDs: sum each range in closed form.
+    """
+    with open(input_file, 'r') as f:
+        data = f.read().strip()
+
+    total = 0
+    for r in data.split(','):
+        start, end = map(int, r.split('-'))
+        total += sum_invalid_ids_in_range_part1(start, end)
+
+    return total
+
+
+def solve_part2_closed_form(input_file):
+    """
+    Part 2 without enumerating IDs: sum each range in closed form.
+    """
+    with open(input_file, 'r') as f:
+        data = f.read().strip()
+
+    total = 0
+    for r in data.split(','):
+        start, end = map(int, r.split('-'))
+        total += sum_invalid_ids_in_range_part2(start, end)
+
+    return total
+
+
+INDEX_MAGIC = b'AOC2IDX1'
+INDEX_HEADER = struct.Struct('<8sQQQ')  # magic, max_digits, part 1 count, part 2 count
+
+
+def _prefix_sums(ids):
+    """
+    Prefix sums of ids as two uint64 arrays (low and high 64 bits), since
+    sums of many large IDs overflow a single 64-bit word.
+    """
+    low = array('Q', [0])
+    high = array('Q', [0])
+    running = 0
+    mask = (1 << 64) - 1
+    for value in ids:
+        running += value
+        low.append(running & mask)
+        high.append(running >> 64)
+    return low, high
+
+
+def build_invalid_id_index(max_digits=12):
+    """
+    Build a sorted index of every invalid ID with at most max_digits digits,
+    for both parts, with prefix sums.
+
+    Returns a dict with 'max_digits' and, per part, the sorted IDs and the
+    prefix sums so any range can be answered with two bisects.
+    """
+    if max_digits > 19:
+        raise ValueError("IDs are stored as uint64, so max_digits is at most 19")
+
+    part1_ids = array('Q')
+    part2_ids = array('Q')
+
+    for total_digits in range(2, max_digits + 1):
+        if total_digits % 2 == 0:
+            half = total_digits // 2
+            multiplier = 10 ** half + 1
+            part1_ids.extend(p * multiplier for p in range(10 ** (half - 1), 10 ** half))
+
+        same_length = set()
+        for pattern_len in range(1, total_digits // 2 + 1):
+            if total_digits % pattern_len != 0:
+                continue
+            multiplier = (10 ** total_digits - 1) // (10 ** pattern_len - 1)
+            same_length.update(p * multiplier for p in range(10 ** (pattern_len - 1), 10 ** pattern_len))
+        part2_ids.extend(sorted(same_length))
+
+    return {
+        'max_digits': max_digits,
+        'part1': (part1_ids,) + _prefix_sums(part1_ids),
+        'part2': (part2_ids,) + _prefix_sums(part2_ids),
+    }
+
+
+def save_invalid_id_index(index, path):
+    """
+    Write the index as a compact binary file: a header followed by, for
+    each part, the IDs and the low/high prefix sums as raw uint64 arrays.
+    """
+    with open(path, 'wb') as f:
+        f.write(INDEX_HEADER.pack(
+            INDEX_MAGIC, index['max_digits'], len(index['part1'][0]), len(index['part2'][0])
+        ))
+        for part in ('part1', 'part2'):
+            for values in index[part]:
+                values = array('Q', values)
+                if sys.byteorder != 'little':
+                    values.byteswap()
+                f.write(values.tobytes())
+
+
+def load_invalid_id_index(path):
+    """
+    Memory-map an index written by save_invalid_id_index.
+
+    Nothing is parsed or copied: the arrays are memoryviews over the mapped
+    file, so a warm start costs only the mmap call.
+    """
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, max_digits, count1, count2 = INDEX_HEADER.unpack_from(mapped)
+    if magic != INDEX_MAGIC:
+        raise ValueError(f"{path} is not an invalid-ID index")
+    if sys.byteorder != 'little':
+        raise ValueError("memory-mapped index requires a little-endian host")
+
+    view = memoryview(mapped)
+    offset = INDEX_HEADER.size
+
+    def take(count):
+        nonlocal offset
+        values = view[offset:offset + 8 * count].cast('Q')
+        offset += 8 * count
+        return values
+
+    index = {'max_digits': max_digits, 'mmap': mapped}
+    for part, count in (('part1', count1), ('part2', count2)):
+        index[part] = (take(count), take(count + 1), take(count + 1))
+    return index
+
+
+def query_invalid_ids(index, start, end, part=2):
+    """
+    Count and sum the invalid IDs in [start, end] with two bisects.
+
+    Returns (count, total).
+    """
+    if len(str(end)) > index['max_digits']:
+        raise ValueError(f"range end {end} exceeds the index's {index['max_digits']} digits")
+
+    ids, low, high = index[f'part{part}']
+    lo = bisect_left(ids, start)
+    hi = bisect_right(ids, end)
+    total = ((high[hi] << 64) | low[hi]) - ((high[lo] << 64) | low[lo])
+    return hi - lo, total
+
+
+def solve_indexed(input_file, part, index=None):
+    """
+    Answer every range of the input from a prebuilt invalid-ID index.
+
+    If no index is given, one is built large enough for the input.
+    """
+    ranges = parse_ranges(input_file)
+    if index is None:
+        index = build_invalid_id_index(max(len(str(end)) for _, end in ranges))
+
+    return sum(query_invalid_ids(index, start, end, part)[1] for start, end in ranges)
+
+
+def parse_ranges(input_file):
+    """Parse the comma-separated "start-end" ranges into (start, end) tuples."""
+    with open(input_file, 'r') as f:
+        data = f.read().strip()
+    return [tuple(map(int, r.split('-'))) for r in data.split(',')]
+
+
+def coalesce_ranges(ranges):
+    """Merge overlapping and adjacent ranges into sorted disjoint ranges."""
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def split_by_digit_length(start, end):
+    """
+    Split [start, end] into sub-ranges that each cover a single digit count,
+    e.g. 95-1050 -> 95-99, 100-999, 1000-1050.
+    """
+    shards = []
+    while start <= end:
+        boundary = 10 ** len(str(start)) - 1
+        shards.append((start, min(end, boundary)))
+        start = boundary + 1
+    return shards
+
+
+def sum_shard(shard, part):
+    """Worker: closed-form sum of the invalid IDs in one shard."""
+    start, end = shard
+    if part == 1:
+        return sum_invalid_ids_in_range_part1(start, end)
+    return sum_invalid_ids_in_range_part2(start, end)
+
+
+def solve_batch(input_file, part, count_shared_once=True, workers=None):
+    """
+    Batch front end for large range lists.
+
+    1. Coalesce overlapping and adjacent ranges (only if count_shared_once)
+    2. Split every range into single-digit-count shards
+    3. Sum the shards across a process pool
+
+    With count_shared_once=True an ID covered by several ranges is counted
+    once. With False every range is summed on its own, which matches
+    solve_part1/solve_part2. Shard results come back in submission order
+    and are added as exact Python ints, so the total is deterministic.
+    """
+    ranges = parse_ranges(input_file)
+    if count_shared_once:
+        ranges = coalesce_ranges(ranges)
+
+    shards = [shard for start, end in ranges for shard in split_by_digit_length(start, end)]
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(shards) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        totals = list(pool.map(sum_shard, shards, [part] * len(shards), chunksize=chunksize))
+
+    return sum(totals)
+
+
 if __name__ == "__main__":
-    import os
     script_dir = os.path.dirname(os.path.abspath(__file__))
     input_file = os.path.join(script_dir, "inputs.txt")
 
@@ -176,3 +568,13 @@ if __name__ == "__main__":
     print("-" * 30)
     print(f"Part 1: {solve_part1(input_file)}")
     print(f"Part 2: {solve_part2(input_file)}")
+    print(f"Part 1 (closed form): {solve_part1_closed_form(input_file)}")
+    print(f"Part 2 (closed form): {solve_part2_closed_form(input_file)}")
+    print(f"Part 1 (indexed): {solve_indexed(input_file, 1)}")
+    print(f"Part 2 (indexed): {solve_indexed(input_file, 2)}")
+
+    if '--batch' in sys.argv:
+        print(f"Part 1 (batch, per range): {solve_batch(input_file, 1, count_shared_once=False)}")
+        print(f"Part 2 (batch, per range): {solve_batch(input_file, 2, count_shared_once=False)}")
+        print(f"Part 1 (batch, shared once): {solve_batch(input_file, 1)}")
+        print(f"Part 2 (batch, shared once): {solve_batch(input_file, 2)}")
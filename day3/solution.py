@@ -14,6 +14,10 @@ To maximize an N-digit number, greedily pick the largest possible digit at each
 while ensuring enough digits remain to fill the remaining positions.
 """
 
+import random
+import timeit
+from array import array
+
 
 def max_joltage_k(bank, k):
     """
@@ -51,6 +55,253 @@ def max_joltage_k(bank, k):
     return int(''.join(result))
 
 
+def max_joltage_k_stack(bank, k):
+    """
+    Same answer as max_joltage_k in O(n) using a monotonic stack.
+
+    This is the classic "remove n-k digits to make the largest number":
+    walk the bank once, and while we may still drop digits, pop any kept
+    digit that is smaller than the incoming one. The first k digits left
+    on the stack are the best selection.
+
+    Works on bytes (a str bank is encoded first) and converts the kept
+    digits straight to an int. Raises ValueError unless 0 < k <= len(bank).
+    """
+    if isinstance(bank, str):
+        bank = bank.encode()
+    if not 0 < k <= len(bank):
+        raise ValueError(f"k must be between 1 and {len(bank)}, got {k}")
+
+    to_drop = len(bank) - k
+    stack = bytearray()
+
+    for digit in bank:
+        while to_drop and stack and stack[-1] < digit:
+            stack.pop()
+            to_drop -= 1
+        stack.append(digit)
+
+    del stack[k:]
+    return int(stack)
+
+
+def build_next_occurrence(bank):
+    """
+    Preprocess a bank for repeated queries.
+
+    Returns a list of 10 arrays where table[d][i] is the first position
+    >= i holding digit d (or n if there is none). Built right to left in
+    O(10 * n).
+    """
+    if isinstance(bank, str):
+        bank = bank.encode()
+
+    n = len(bank)
+    table = [array('i', [n]) * (n + 1) for _ in range(10)]
+
+    for i in range(n - 1, -1, -1):
+        for d in range(10):
+            table[d][i] = table[d][i + 1]
+        table[bank[i] - 48][i] = i
+
+    return table
+
+
+def max_joltage_from_table(table, k):
+    """
+    Same answer as max_joltage_k, read off a next-occurrence table.
+
+    Each of the k picks tries digits 9 down to 0 and takes the first one
+    whose next occurrence still fits in the window, so a query costs
+    O(10 * k) however long the bank is. Raises ValueError unless
+    0 < k <= len(bank).
+    """
+    n = len(table[0]) - 1
+    if not 0 < k <= n:
+        raise ValueError(f"k must be between 1 and {n}, got {k}")
+
+    value = 0
+    start = 0
+
+    for i in range(k):
+        end = n - k + i
+        for d in range(9, -1, -1):
+            pos = table[d][start]
+            if pos <= end:
+                value = value * 10 + d
+                start = pos + 1
+                break
+
+    return value
+
+
+def solve_many_k(input_file, ks):
+    """
+    Sum the maximum joltage over all banks for every k in ks.
+
+    Each bank's next-occurrence table is built once and reused for all
+    requested k. Returns a dict {k: total}.
+    """
+    with open(input_file, 'r') as f:
+        banks = f.read().strip().split('\n')
+
+    totals = dict.fromkeys(ks, 0)
+    for bank in banks:
+        table = build_next_occurrence(bank)
+        for k in totals:
+            totals[k] += max_joltage_from_table(table, k)
+
+    return totals
+
+
+def load_bank_matrix(input_file):
+    """
+    Load fixed-width banks as a uint8 digit matrix (rows = banks) straight
+    from the raw bytes.
+
+    Returns None if the lines do not all have the same width.
+    """
+    import numpy as np
+
+    with open(input_file, 'rb') as f:
+        raw = np.frombuffer(f.read().strip(), dtype=np.uint8)
+
+    newlines = np.flatnonzero(raw == ord('\n'))
+    width = int(newlines[0]) if newlines.size else raw.size
+    rows = newlines.size + 1
+
+    # Fixed width means every newline sits at the end of a width-byte line
+    if raw.size != rows * (width + 1) - 1:
+        return None
+    if not np.array_equal(newlines, np.arange(1, rows) * (width + 1) - 1):
+        return None
+
+    matrix = np.append(raw, np.uint8(ord('\n'))).reshape(rows, width + 1)
+    return matrix[:, :width] - np.uint8(ord('0'))
+
+
+def total_joltage_numpy(input_file, k):
+    """
+    Sum of max_joltage_k(bank, k) over all banks, with every bank processed
+    at once.
+
+    Runs the same greedy as max_joltage_k on all rows together: for each of
+    the k picks, mask every column outside the row's window [start, n-k+i]
+    and take the row-wise argmax (argmax returns the leftmost maximum, just
+    like the scalar scan). The picked digits are summed per column and
+    combined with Python ints, so the total cannot overflow for large k.
+
+    Ragged input falls back to the scalar max_joltage_k.
+    """
+    import numpy as np
+
+    digits = load_bank_matrix(input_file)
+    if digits is None:
+        with open(input_file, 'r') as f:
+            banks = f.read().strip().split('\n')
+        return sum(max_joltage_k(bank, k) for bank in banks)
+
+    rows, n = digits.shape
+    columns = np.arange(n)
+    start = np.zeros(rows, dtype=np.int64)
+    row_ids = np.arange(rows)
+    total = 0
+
+    for i in range(k):
+        end = n - k + i
+        outside = (columns[None, :] < start[:, None]) | (columns[None, :] > end)
+        masked = np.where(outside, -1, digits.astype(np.int8))
+        best_pos = masked.argmax(axis=1)
+
+        total = total * 10 + int(digits[row_ids, best_pos].sum(dtype=np.int64))
+        start = best_pos + 1
+
+    return total
+
+
+def build_bank_tree(bank):
+    """
+    Build a mutable bank backed by a range-max segment tree, in O(n).
+
+    The tree is a flat array with leaves at [size, 2*size). Each node stores
+    digit * size + (size - 1 - pos), so the largest key is the largest digit
+    and, among equal digits, the leftmost position.
+    """
+    if isinstance(bank, str):
+        bank = bank.encode()
+
+    n = len(bank)
+    size = 1
+    while size < n:
+        size *= 2
+
+    tree = array('q', [-1]) * (2 * size)
+    for pos, digit in enumerate(bank):
+        tree[size + pos] = (digit - 48) * size + (size - 1 - pos)
+    for node in range(size - 1, 0, -1):
+        tree[node] = max(tree[2 * node], tree[2 * node + 1])
+
+    return {'n': n, 'size': size, 'tree': tree}
+
+
+def update_bank_tree(bank_tree, pos, digit):
+    """Swap the battery at pos for digit, in O(log n)."""
+    size = bank_tree['size']
+    tree = bank_tree['tree']
+
+    node = size + pos
+    tree[node] = digit * size + (size - 1 - pos)
+    node //= 2
+    while node:
+        tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        node //= 2
+
+
+def leftmost_max(bank_tree, lo, hi):
+    """(digit, pos) of the leftmost largest digit in [lo, hi], in O(log n)."""
+    size = bank_tree['size']
+    tree = bank_tree['tree']
+
+    best = -1
+    lo += size
+    hi += size + 1
+    while lo < hi:
+        if lo & 1:
+            best = max(best, tree[lo])
+            lo += 1
+        if hi & 1:
+            hi -= 1
+            best = max(best, tree[hi])
+        lo //= 2
+        hi //= 2
+
+    digit, rest = divmod(best, size)
+    return digit, size - 1 - rest
+
+
+def max_joltage_tree(bank_tree, k):
+    """
+    Same answer as max_joltage_k, with each window scan replaced by a
+    segment-tree query: O(k log n).
+    """
+    n = bank_tree['n']
+    value = 0
+    start = 0
+
+    for i in range(k):
+        digit, pos = leftmost_max(bank_tree, start, n - k + i)
+        value = value * 10 + digit
+        start = pos + 1
+
+    return value
+
+
+def load_bank_trees(input_file):
+    """Build a segment-tree bank for every line of the input."""
+    with open(input_file, 'rb') as f:
+        return [build_bank_tree(line.strip()) for line in f if line.strip()]
+
+
 def max_joltage(bank):
     """
     Find the maximum joltage from a bank of batteries.
@@ -113,7 +364,26 @@ def solve_part2(input_file):
     return total
 
 
+def benchmark(n=20000, ks=(2, 12, 100, 500), repeat=3):
+    """
+    Time max_joltage_k (window rescans, O(n*k)) against max_joltage_k_stack
+    (monotonic stack, O(n)) on a random bank of n digits.
+    """
+    rng = random.Random(2025)
+    bank = ''.join(rng.choice('123456789') for _ in range(n))
+    bank_bytes = bank.encode()
+
+    print(f"Benchmark: bank of {n} digits (best of {repeat})")
+    print(f"  {'k':>5}  {'rescan':>10}  {'stack':>10}  {'speedup':>8}")
+    for k in ks:
+        assert max_joltage_k(bank, k) == max_joltage_k_stack(bank_bytes, k)
+        rescan = min(timeit.repeat(lambda: max_joltage_k(bank, k), number=1, repeat=repeat))
+        stack = min(timeit.repeat(lambda: max_joltage_k_stack(bank_bytes, k), number=1, repeat=repeat))
+        print(f"  {k:>5}  {rescan * 1000:>8.2f}ms  {stack * 1000:>8.2f}ms  {rescan / stack:>7.1f}x")
+
+
 if __name__ == "__main__":
+    import sys
     import os
     script_dir = os.path.dirname(os.path.abspath(__file__))
     input_file = os.path.join(script_dir, "inputs.txt")
@@ -122,3 +392,16 @@ if __name__ == "__main__":
     print("-" * 30)
     print(f"Part 1: {solve_part1(input_file)}")
     print(f"Part 2: {solve_part2(input_file)}")
+
+    if '--bench' in sys.argv:
+        print()
+        benchmark()
+
+    if '--numpy' in sys.argv:
+        print(f"Part 1 (NumPy): {total_joltage_numpy(input_file, 2)}")
+        print(f"Part 2 (NumPy): {total_joltage_numpy(input_file, 12)}")
+
+    if '--many-k' in sys.argv:
+        print()
+        for k, total in solve_many_k(input_file, range(1, 21)).items():
+            print(f"k={k:>2}: {total}")
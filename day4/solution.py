@@ -8,6 +8,18 @@ Part 1: Count accessible rolls (in a single pass)
 Part 2: Count total rolls that can be removed by repeatedly removing accessible rolls
 """
 
+import csv
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
 
 def parse_input(input_file):
     """Parse the input file into a 2D grid."""
@@ -143,7 +155,7 @@ def find_accessible_rolls(grid):
     return accessible
 
 
-def solve_part2(input_file, visualize=False):
+def solve_part2(input_file, visualize=False, recording=None, telemetry=None):
     """
     Count total rolls that can be removed by repeatedly removing accessible rolls.
 
@@ -152,6 +164,12 @@ def solve_part2(input_file, visualize=False):
     2. Remove them all
     3. Repeat until no more rolls are accessible
     4. Return total count of removed rolls
+
+    Pass an empty dict as recording to capture every round for later replay
+    (it is filled in from the grid being peeled), and a list as telemetry to collect per-round
+    stats (see write_telemetry). There is one record per removal round, as
+    with solve_part2_worklist: the final scan that finds nothing to remove
+    is folded into the last round's stats.
     """
     grid = parse_input(input_file)
     # Convert to mutable list of lists
@@ -160,6 +178,14 @@ def solve_part2(input_file, visualize=False):
     total_removed = 0
     iteration = 0
 
+    if recording is not None:
+        recording.update(new_recording(grid))
+
+    if telemetry is not None:
+        initial_rolls = sum(row.count('@') for row in grid)
+        cells = sum(len(row) for row in grid)
+        round_start = time.perf_counter()
+
     if visualize:
         # Count initial rolls
         initial_rolls = sum(row.count('@') for row in grid)
@@ -172,6 +198,10 @@ def solve_part2(input_file, visualize=False):
 
         if not accessible:
             # No more rolls can be removed
+            if telemetry is not None and iteration:
+                # The last, empty scan is real work too: fold it into the last round
+                telemetry[-1]['seconds'] += time.perf_counter() - round_start
+                telemetry[-1]['cells_examined'] += cells + 8 * (initial_rolls - total_removed)
             break
 
         iteration += 1
@@ -182,12 +212,25 @@ def solve_part2(input_file, visualize=False):
             # Show grid with accessible rolls highlighted
             print_grid_with_highlights(grid, accessible)
 
+        if recording is not None:
+            record_round(recording, accessible)
+
         # Remove all accessible rolls
         for row, col in accessible:
             grid[row][col] = '.'
 
         total_removed += len(accessible)
 
+        if telemetry is not None:
+            # Every cell is visited, and every roll probes its 8 neighbors
+            rolls_scanned = initial_rolls - (total_removed - len(accessible))
+            now = time.perf_counter()
+            telemetry.append(round_stats(
+                iteration, len(accessible), initial_rolls - total_removed,
+                now - round_start, cells + 8 * rolls_scanned,
+            ))
+            round_start = now
+
         if visualize:
             remaining = sum(row.count('@') for row in grid)
             print(f"Total removed so far: {total_removed}, Remaining: {remaining}")
@@ -225,18 +268,14 @@ def print_grid_with_highlights(grid, highlights, max_rows=20):
     """
     Print grid with highlighted positions shown as 'X' (rolls about to be removed).
     """
-    highlight_set = set(highlights)
     rows = len(grid)
 
     if rows <= max_rows:
-        for r, row in enumerate(grid):
-            line = ''
-            for c, char in enumerate(row):
-                if (r, c) in highlight_set:
-                    line += 'X'  # Highlighted (about to be removed)
-                else:
-                    line += char
-            print(line)
+        lines = [bytearray(''.join(row), 'ascii') for row in grid]
+        for r, c in highlights:
+            lines[r][c] = ord('X')  # Highlighted (about to be removed)
+        for line in lines:
+            print(line.decode())
     else:
         print(f"  ({len(highlights)} rolls marked for removal across {rows} rows)")
 
@@ -278,21 +317,13 @@ def visualize_example():
             break
 
         iteration += 1
-        highlight_set = set(accessible)
 
         print(f"\n{'-'*60}")
         print(f"Iteration {iteration}: Found {len(accessible)} accessible rolls (marked X)")
         print()
 
         # Print with highlights
-        for r, row in enumerate(example_grid):
-            line = ''
-            for c, char in enumerate(row):
-                if (r, c) in highlight_set:
-                    line += 'X'
-                else:
-                    line += char
-            print(line)
+        print_grid_with_highlights(example_grid, accessible)
 
         # Remove rolls
         for row, col in accessible:
@@ -319,6 +350,124 @@ def visualize_example():
     print("=" * 60)
 
 
+RECORDING_MAGIC = b'AOC4REC1'
+RECORDING_HEADER = struct.Struct('<8sIII')  # magic, rows, cols, frame count
+
+
+def new_recording(grid):
+    """
+    Start a recording of the removal process on grid.
+
+    A recording keeps the starting grid once and then one compact delta per
+    round: the flat indices (row * cols + col) of the rolls removed, packed
+    in an array('I').
+    """
+    rows = len(grid)
+    cols = len(grid[0]) if rows > 0 else 0
+    return {
+        'rows': rows,
+        'cols': cols,
+        'base': bytearray(''.join(''.join(row) for row in grid), 'ascii'),
+        'frames': [],
+    }
+
+
+def record_round(recording, removed):
+    """Append one round's removed (row, col) positions to the recording."""
+    cols = recording['cols']
+    recording['frames'].append(array('I', [r * cols + c for r, c in removed]))
+
+
+def save_recording(recording, path):
+    """
+    Write a replayable recording: header, the base grid bytes, then every
+    frame as a uint32 count followed by its uint32 cell indices.
+    """
+    with open(path, 'wb') as f:
+        f.write(RECORDING_HEADER.pack(
+            RECORDING_MAGIC, recording['rows'], recording['cols'], len(recording['frames'])
+        ))
+        f.write(recording['base'])
+        for frame in recording['frames']:
+            frame = array('I', frame)
+            if sys.byteorder != 'little':
+                frame.byteswap()
+            f.write(struct.pack('<I', len(frame)))
+            f.write(frame.tobytes())
+
+
+def load_recording(path):
+    """Read a recording written by save_recording."""
+    with open(path, 'rb') as f:
+        magic, rows, cols, n_frames = RECORDING_HEADER.unpack(f.read(RECORDING_HEADER.size))
+        if magic != RECORDING_MAGIC:
+            raise ValueError(f"{path} is not a removal recording")
+
+        base = bytearray(f.read(rows * cols))
+        frames = []
+        for _ in range(n_frames):
+            (count,) = struct.unpack('<I', f.read(4))
+            frame = array('I')
+            frame.frombytes(f.read(4 * count))
+            if sys.byteorder != 'little':
+                frame.byteswap()
+            frames.append(frame)
+
+    return {'rows': rows, 'cols': cols, 'base': base, 'frames': frames}
+
+
+def _round_codes(recording):
+    """
+    One byte per cell saying when it goes: 0 for empty, 1 + round for the
+    first 253 rounds, 254 for anything later and 255 for rolls that stay.
+    Built once per recording and cached.
+    """
+    codes = recording.get('codes')
+    if codes is None:
+        codes = recording['base'].translate(bytes.maketrans(b'@.', b'\xff\x00'))
+        for i, frame in enumerate(recording['frames']):
+            code = min(i + 1, 254)
+            for cell in frame:
+                codes[cell] = code
+        recording['codes'] = codes
+    return codes
+
+
+def render_frame(recording, i):
+    """
+    Render round i (0-based) lazily: the grid as it was before the round,
+    with the rolls about to be removed shown as 'X'. Returns a list of row
+    strings.
+
+    For the first 253 rounds this is a single bytes.translate over the
+    round codes: earlier rounds map to '.', this round to 'X' and later
+    rounds to '@'. Beyond that the late cells are patched from the deltas.
+    """
+    codes = _round_codes(recording)
+    frames = recording['frames']
+
+    table = bytearray(256)
+    table[0] = ord('.')
+    shown = min(i + 1, 254)
+    for code in range(1, 256):
+        if code < shown:
+            table[code] = ord('.')
+        elif code == shown and code < 254:
+            table[code] = ord('X')
+        else:
+            table[code] = ord('@')
+    frame = codes.translate(table)
+
+    # Rounds past the 253 that fit in a byte share code 254: patch them
+    for late in range(253, i + 1):
+        mark = ord('X') if late == i else ord('.')
+        for cell in frames[late]:
+            frame[cell] = mark
+
+    cols = recording['cols']
+    return [frame[r * cols:(r + 1) * cols].decode() for r in range(recording['rows'])]
+
+
 def verify_example_part2():
     """Verify Part 2 solution with the example from the problem."""
     example_grid = [
@@ -360,10 +509,479 @@ def verify_example_part2():
     return total_removed == 43
 
 
-if __name__ == "__main__":
-    import sys
-    import os
+def parse_bitboard(input_file):
+    """
+    Parse the grid into one big-int bitmask per row (bit c set = roll at
+    column c). Returns (rows, cols).
+    """
+    grid = parse_input(input_file)
+    cols = len(grid[0]) if grid else 0
+    table = str.maketrans('@.', '10')
+    # Reverse each row so column 0 lands on bit 0
+    rows = [int(line.translate(table)[::-1], 2) for line in grid]
+    return rows, cols
+
+
+def accessible_row(above, here, below, cols):
+    """
+    Accessible rolls of one bitboard row, given the rows around it.
+
+    The 8 neighbor masks are the rows above, beside and below shifted one
+    column left/right. They are added with a bit-sliced counter: b0 and b1
+    hold the low two bits of every cell's neighbor count and at_least_4
+    latches any carry out of b1, so a roll is accessible exactly where
+    at_least_4 is clear.
+    """
+    full = (1 << cols) - 1
+    neighbors = (
+        (above << 1) & full, above, above >> 1,
+        (here << 1) & full, here >> 1,
+        (below << 1) & full, below, below >> 1,
+    )
+
+    b0 = b1 = at_least_4 = 0
+    for bits in neighbors:
+        carry = b0 & bits
+        b0 ^= bits
+        at_least_4 |= b1 & carry
+        b1 ^= carry
+
+    return here & ~at_least_4
+
+
+def accessible_bitboard(rows, cols):
+    """Accessible rolls of every row at once, as bitmasks."""
+    padded = [0] + rows + [0]
+    return [accessible_row(padded[r - 1], padded[r], padded[r + 1], cols)
+            for r in range(1, len(padded) - 1)]
+
+
+def solve_part1_bitboard(input_file):
+    """Part 1 on the bitboard engine."""
+    rows, cols = parse_bitboard(input_file)
+    return sum(mask.bit_count() for mask in accessible_bitboard(rows, cols))
+
+
+def solve_part1_streaming(source, on_accessible=None):
+    """
+    Part 1 over a grid that arrives line by line (a path or an open file
+    such as sys.stdin), holding only a three-row window.
+
+    Row r is settled as soon as row r+1 arrives, so accessible rolls are
+    reported while the grid is still streaming in: on_accessible(row, col)
+    is called for each one if given. Memory is O(cols). Returns the count.
+    """
+    if isinstance(source, (str, bytes, os.PathLike)):
+        with open(source, 'rb') as f:
+            return solve_part1_streaming(f, on_accessible)
+
+    to_bits = bytes.maketrans(b'@.', b'10')
+
+    def bitboard(line):
+        return int(line.translate(to_bits)[::-1], 2)
+
+    stream = getattr(source, 'buffer', source)
+    lines = (line.rstrip(b'\r\n') for line in stream)
+    lines = (line for line in lines if line.strip())
+
+    count = 0
+    above = b''
+    here = next(lines, None)
+    row = 0
+    while here is not None:
+        below = next(lines, None)
+        cols = len(here)
+        mask = accessible_row(
+            bitboard(above) if above else 0,
+            bitboard(here),
+            bitboard(below) if below else 0,
+            cols,
+        )
+
+        count += mask.bit_count()
+        if on_accessible is not None:
+            while mask:
+                low = mask & -mask
+                on_accessible(row, low.bit_length() - 1)
+                mask ^= low
+
+        above, here = here, below
+        row += 1
+
+    return count
+
+
+def solve_part2_bitboard(input_file):
+    """
+    Part 2 on the bitboard engine: same rounds as solve_part2, but each
+    round clears all accessible rolls of a row with one mask.
+    """
+    rows, cols = parse_bitboard(input_file)
+    total_removed = 0
+
+    while True:
+        accessible = accessible_bitboard(rows, cols)
+        removed = sum(mask.bit_count() for mask in accessible)
+        if not removed:
+            break
+
+        rows = [row & ~mask for row, mask in zip(rows, accessible)]
+        total_removed += removed
+
+    return total_removed
+
+
+def padded_neighbor_counts(grid):
+    """
+    Flatten the grid with one cell of padding on every side, so neighbors
+    never need bounds checks.
+
+    Returns (width, present, counts, offsets): the padded row width, a
+    bytearray of occupied cells, every roll's neighbor count, and the 8
+    flat neighbor offsets.
+    """
+    rows = len(grid)
+    cols = len(grid[0]) if rows > 0 else 0
+    width = cols + 2
+
+    present = bytearray(width * (rows + 2))
+    for r, line in enumerate(grid):
+        for c, char in enumerate(line):
+            if char == '@':
+                present[(r + 1) * width + c + 1] = 1
+
+    offsets = (-width - 1, -width, -width + 1, -1, 1, width - 1, width, width + 1)
+    counts = [0] * len(present)
+    for cell, occupied in enumerate(present):
+        if occupied:
+            counts[cell] = sum(present[cell + d] for d in offsets)
+
+    return width, present, counts, offsets
+
+
+def peel_rounds(grid, threshold=4, stats=None):
+    """
+    Run the part 2 removal process with a worklist instead of rescanning
+    the grid every round.
+
+    Every roll's neighbor count is computed once. Removing a roll
+    decrements its 8 neighbors, and a neighbor joins the next round only
+    when its count drops from threshold to threshold - 1. Each round still
+    removes exactly the rolls that were accessible at its start, so the
+    rounds match solve_part2 one for one, while total work is proportional
+    to the number of rolls.
+
+    Yields, for every round, the list of (row, col) positions removed.
+    If a stats dict is given, stats['cells_examined'] is kept up to date.
+    """
+    width, present, counts, offsets = padded_neighbor_counts(grid)
+    frontier = [cell for cell, occupied in enumerate(present)
+                if occupied and counts[cell] < threshold]
+
+    if stats is not None:
+        # Setup scans every padded cell and the 8 neighbors of every roll
+        rolls = sum(present)
+        stats['cells_examined'] = len(present) + 8 * rolls
+
+    while frontier:
+        for cell in frontier:
+            present[cell] = 0
+
+        next_frontier = []
+        for cell in frontier:
+            for d in offsets:
+                neighbor = cell + d
+                if present[neighbor]:
+                    counts[neighbor] -= 1
+                    if counts[neighbor] == threshold - 1:
+                        next_frontier.append(neighbor)
+
+        if stats is not None:
+            stats['cells_examined'] += 9 * len(frontier)
+
+        yield [(cell // width - 1, cell % width - 1) for cell in frontier]
+        frontier = next_frontier
+
+
+def solve_part2_worklist(input_file, visualize=False, telemetry=None):
+    """
+    Part 2 on the worklist engine. With visualize=True it prints the same
+    per-iteration removal counts as solve_part2; telemetry works as in
+    solve_part2.
+    """
+    grid = parse_input(input_file)
+    total_removed = 0
+
+    stats = None
+    if telemetry is not None:
+        stats = {}
+        initial_rolls = sum(row.count('@') for row in grid)
+        round_start = time.perf_counter()
 
+    for iteration, removed in enumerate(peel_rounds(grid, stats=stats), start=1):
+        total_removed += len(removed)
+        if visualize:
+            print(f"Iteration {iteration}: Removing {len(removed)} rolls")
+        if telemetry is not None:
+            now = time.perf_counter()
+            telemetry.append(round_stats(
+                iteration, len(removed), initial_rolls - total_removed,
+                now - round_start, stats['cells_examined'],
+            ))
+            stats['cells_examined'] = 0
+            round_start = now
+
+    return total_removed
+
+
+TELEMETRY_FIELDS = ('round', 'removed', 'remaining', 'seconds', 'cells_examined')
+
+
+def round_stats(iteration, removed, remaining, seconds, cells_examined):
+    """One telemetry record for a removal round."""
+    return dict(zip(TELEMETRY_FIELDS, (iteration, removed, remaining, seconds, cells_examined)))
+
+
+def write_telemetry(telemetry, path, fmt=None):
+    """
+    Export per-round telemetry as JSON Lines or CSV.
+
+    fmt is 'jsonl' or 'csv'; by default it follows the file extension.
+    """
+    if fmt is None:
+        fmt = 'csv' if path.endswith('.csv') else 'jsonl'
+
+    with open(path, 'w', newline='') as f:
+        if fmt == 'csv':
+            writer = csv.DictWriter(f, fieldnames=TELEMETRY_FIELDS)
+            writer.writeheader()
+            writer.writerows(telemetry)
+        elif fmt == 'jsonl':
+            for record in telemetry:
+                f.write(json.dumps(record) + '\n')
+        else:
+            raise ValueError(f"unknown telemetry format: {fmt}")
+
+
+def decompose_rolls(grid):
+    """
+    Core decomposition of the rolls on the 8-neighbor graph, so the removal
+    process can be answered for every threshold t in 1..8 (remove rolls
+    with fewer than t neighbors) from one precomputation.
+
+    A bucket queue (degrees are at most 8) peels rolls in order of current
+    degree and gives every roll its core number: the largest k such that
+    the roll survives removal with threshold k. With threshold t, exactly
+    the rolls with core < t are removed, so the smallest threshold that
+    removes a roll is core + 1.
+
+    The round a roll goes in depends on t, so the rounds are replayed per
+    threshold, but only over the rolls that threshold removes (cores tell
+    us which) and from the shared neighbor counts, never over the grid.
+
+    Returns a dict with:
+    - 'min_threshold': {(row, col): smallest t that removes the roll (9 if none)}
+    - 'rounds': {(row, col): tuple of its removal round for t = 1..8, 0 if kept}
+    - 'removed': {t: total rolls removed}
+    - 'iterations': {t: rounds needed}
+    """
+    width, present, counts, offsets = padded_neighbor_counts(grid)
+    rolls = [cell for cell, occupied in enumerate(present) if occupied]
+
+    # Bucket-queue peeling for core numbers
+    degree = list(counts)
+    buckets = [[] for _ in range(9)]
+    for cell in rolls:
+        buckets[degree[cell]].append(cell)
+
+    core = {}
+    for d in range(9):
+        bucket = buckets[d]
+        while bucket:
+            cell = bucket.pop()
+            if cell in core or degree[cell] != d:
+                continue  # Stale entry
+            core[cell] = d
+            for offset in offsets:
+                neighbor = cell + offset
+                if present[neighbor] and neighbor not in core and degree[neighbor] > d:
+                    degree[neighbor] -= 1
+                    buckets[degree[neighbor]].append(neighbor)
+
+    # Round-by-round replay per threshold, restricted to removed rolls
+    round_of = {cell: [0] * 8 for cell in rolls}
+    removed = {}
+    iterations = {}
+    for t in range(1, 9):
+        remaining = {cell: counts[cell] for cell in rolls if core[cell] < t}
+        frontier = [cell for cell in remaining if counts[cell] < t]
+        iteration = 0
+
+        while frontier:
+            iteration += 1
+            for cell in frontier:
+                round_of[cell][t - 1] = iteration
+                del remaining[cell]
+
+            next_frontier = []
+            for cell in frontier:
+                for offset in offsets:
+                    neighbor = cell + offset
+                    if neighbor in remaining:
+                        remaining[neighbor] -= 1
+                        if remaining[neighbor] == t - 1:
+                            next_frontier.append(neighbor)
+            frontier = next_frontier
+
+        removed[t] = sum(1 for cell in rolls if core[cell] < t)
+        iterations[t] = iteration
+
+    def position(cell):
+        return (cell // width - 1, cell % width - 1)
+
+    return {
+        'min_threshold': {position(cell): core[cell] + 1 for cell in rolls},
+        'rounds': {position(cell): tuple(round_of[cell]) for cell in rolls},
+        'removed': removed,
+        'iterations': iterations,
+    }
+
+
+def total_removed_for_threshold(decomposition, t):
+    """Rolls removed when rolls with fewer than t neighbors are removed."""
+    return decomposition['removed'][t]
+
+
+def rounds_for_threshold(decomposition, t):
+    """Rounds the removal process takes with threshold t."""
+    return decomposition['iterations'][t]
+
+
+def grid_file_shape(path):
+    """
+    Shape of a fixed-width grid file: (rows, cols). Every row, including
+    the last, must end with a newline.
+    """
+    with open(path, 'rb') as f:
+        cols = len(f.readline().rstrip(b'\n'))
+    rows = os.path.getsize(path) // (cols + 1)
+    return rows, cols
+
+
+def process_tile(src_path, dst_path, rows, cols, tile):
+    """
+    Worker: run one removal round on one tile.
+
+    Reads the tile plus a one-cell halo from the memory-mapped src grid,
+    finds the accessible rolls with the bitboard counter and writes the
+    tile's new state into dst. Only the tile's own cells are written, so
+    tiles never conflict. Returns the number of rolls removed.
+    """
+    r0, r1, c0, c1 = tile
+    stride = cols + 1
+    h0, h1 = max(r0 - 1, 0), min(r1 + 1, rows)
+    g0, g1 = max(c0 - 1, 0), min(c1 + 1, cols)
+    width = g1 - g0
+    # Rolls become 1 and every other byte (including a stray '\r') becomes 0
+    to_bits = bytearray(b'0' * 256)
+    to_bits[ord('@')] = ord('1')
+
+    with open(src_path, 'rb') as f:
+        src = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        halo = [int(src[r * stride + g0:r * stride + g1].translate(to_bits)[::-1], 2)
+                for r in range(h0, h1)]
+        src.close()
+
+    accessible = accessible_bitboard(halo, width)
+
+    # Keep only the tile's own cells, not the halo
+    tile_mask = ((1 << (c1 - c0)) - 1) << (c0 - g0)
+    removed = 0
+    lines = []
+    for r in range(r0, r1):
+        mask = accessible[r - h0] & tile_mask
+        removed += mask.bit_count()
+        row = (halo[r - h0] & ~mask & tile_mask) >> (c0 - g0)
+        bits = format(row, f'0{c1 - c0}b')[::-1]
+        lines.append((r, bits.replace('1', '@').replace('0', '.').encode()))
+
+    with open(dst_path, 'r+b') as f:
+        dst = mmap.mmap(f.fileno(), 0)
+        for r, line in lines:
+            dst[r * stride + c0:r * stride + c1] = line
+        dst.close()
+
+    return removed
+
+
+def solve_tiled(input_file, tile_rows=256, tile_cols=4096, workers=None, work_dir=None):
+    """
+    Solve both parts on a tiled, memory-mapped grid with a process pool.
+
+    The grid lives in two working files (double buffering). Each round,
+    every tile reads its cells and a one-cell halo of its neighbors' borders
+    from the current buffer and writes its new state into the other one;
+    the round ends when all tiles are done, so every tile sees its
+    neighbors' borders from the same round, like solve_part2. Memory per
+    worker is bounded by the tile size rather than the grid size.
+
+    The working files go in work_dir, by default the input's own directory
+    (the system temp directory is often RAM-backed, which would defeat the
+    point for grids larger than memory).
+
+    The first round's removals are the part 1 answer. Returns (part1, part2).
+    """
+    workers = workers or os.cpu_count() or 1
+    work_dir = work_dir or os.path.dirname(os.path.abspath(input_file))
+
+    with tempfile.TemporaryDirectory(dir=work_dir) as tmp:
+        buffers = [os.path.join(tmp, 'grid_a'), os.path.join(tmp, 'grid_b')]
+        with open(input_file, 'rb') as src, open(buffers[0], 'w+b') as dst:
+            newline = b'\r\n' if src.readline().endswith(b'\r\n') else b'\n'
+            src.seek(0)
+            shutil.copyfileobj(src, dst)
+            # Make sure the last row ends like the others; a '\r' before the
+            # newline is just one more empty column to process_tile
+            if dst.tell():
+                dst.seek(-1, os.SEEK_END)
+                if dst.read(1) != b'\n':
+                    dst.write(newline)
+        shutil.copyfile(buffers[0], buffers[1])
+
+        rows, cols = grid_file_shape(buffers[0])
+        tiles = [(r, min(r + tile_rows, rows), c, min(c + tile_cols, cols))
+                 for r in range(0, rows, tile_rows)
+                 for c in range(0, cols, tile_cols)]
+
+        part1 = None
+        total_removed = 0
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            while True:
+                src_path, dst_path = buffers
+                removed = sum(pool.map(
+                    process_tile,
+                    [src_path] * len(tiles), [dst_path] * len(tiles),
+                    [rows] * len(tiles), [cols] * len(tiles), tiles,
+                ))
+                if part1 is None:
+                    part1 = removed
+                if not removed:
+                    break
+                total_removed += removed
+                buffers.reverse()
+
+    return part1, total_removed
+
+
+def output_path(flag, default_name):
+    """Path given after a command-line flag, else default_name in the temp directory."""
+    i = sys.argv.index(flag)
+    if i + 1 < len(sys.argv) and not sys.argv[i + 1].startswith('-'):
+        return sys.argv[i + 1]
+    return os.path.join(tempfile.gettempdir(), default_name)
+
+
+if __name__ == "__main__":
     script_dir = os.path.dirname(os.path.abspath(__file__))
     input_file = os.path.join(script_dir, "inputs.txt")
 
@@ -379,5 +997,47 @@ if __name__ == "__main__":
     print(f"Part 1: {solve_part1(input_file)}")
     print(f"Part 2: {solve_part2(input_file, visualize=False)}")
 
+    if '--bitboard' in sys.argv:
+        print(f"Part 1 (bitboard): {solve_part1_bitboard(input_file)}")
+        print(f"Part 2 (bitboard): {solve_part2_bitboard(input_file)}")
+
+    if '-' in sys.argv:
+        # Stream the grid from stdin, e.g. `cat huge_grid.txt | python solution.py -`
+        print(f"Part 1 (streaming stdin): {solve_part1_streaming(sys.stdin)}")
+
+    if '--worklist' in sys.argv:
+        print(f"Part 2 (worklist): {solve_part2_worklist(input_file)}")
+
+    if '--tiled' in sys.argv:
+        part1, part2 = solve_tiled(input_file)
+        print(f"Part 1 (tiled): {part1}")
+        print(f"Part 2 (tiled): {part2}")
+
+    if '--record' in sys.argv:
+        recording_path = output_path('--record', "day4_removal.rec")
+        recording = {}
+        solve_part2(input_file, recording=recording)
+        save_recording(recording, recording_path)
+        print(f"Recorded {len(recording['frames'])} rounds to {recording_path}")
+
+    if '--telemetry' in sys.argv:
+        # One file per engine, e.g. `--telemetry run.csv` -> run_rescan.csv, run_worklist.csv
+        root, ext = os.path.splitext(output_path('--telemetry', "day4_telemetry.jsonl"))
+        for name, engine in (('rescan', solve_part2), ('worklist', solve_part2_worklist)):
+            telemetry = []
+            engine(input_file, telemetry=telemetry)
+            telemetry_path = f"{root}_{name}{ext}"
+            write_telemetry(telemetry, telemetry_path)
+            seconds = sum(record['seconds'] for record in telemetry)
+            examined = sum(record['cells_examined'] for record in telemetry)
+            print(f"  {name}: {len(telemetry)} rounds, {seconds:.3f}s, "
+                  f"{examined} cells examined -> {telemetry_path}")
+
+    if '--thresholds' in sys.argv:
+        decomposition = decompose_rolls(parse_input(input_file))
+        for t in range(1, 9):
+            print(f"  threshold {t}: {total_removed_for_threshold(decomposition, t)} removed "
+                  f"in {rounds_for_threshold(decomposition, t)} rounds")
+
     if not show_visual:
         print("\nTip: Run with --visual flag for step-by-step visualization")
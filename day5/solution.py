@@ -9,6 +9,18 @@ Ranges are inclusive and can overlap.
 Part 1: Count how many available ingredient IDs are fresh
 """
 
+import hashlib
+import heapq
+import itertools
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+
 
 def parse_input(input_file):
     """
@@ -38,6 +50,108 @@ def parse_input(input_file):
     return ranges, ingredients
 
 
+BLANK_LINE = re.compile(rb'\r?\n[ \t\r]*\n')  # Section separator, LF or CRLF
+
+
+def read_range_section(input_file, block_size=1 << 20):
+    """
+    Raw bytes of the ranges section, reading the file only up to the blank
+    line that ends it (LF or CRLF, possibly holding stray whitespace).
+
+    Returns (range_section, offset) where offset is the byte position at
+    which the ingredients section starts, so it can be read later without
+    rescanning the ranges.
+    """
+    with open(input_file, 'rb') as f:
+        buffer = bytearray()
+        search_from = None  # Set once we are past any leading whitespace
+        while True:
+            block = f.read(block_size)
+            buffer += block
+
+            if search_from is None:
+                first = len(buffer) - len(buffer.lstrip())
+                if first == len(buffer) and block:
+                    continue
+                search_from = first
+
+            match = BLANK_LINE.search(buffer, search_from)
+            if match:
+                return bytes(buffer[:match.start()]), match.end()
+            if not block:
+                return bytes(buffer), len(buffer)
+
+            # A blank line straddling the next block starts at the last newline read
+            search_from = max(buffer.rfind(b'\n', search_from) - 1, search_from)
+
+
+def iter_range_lines(lines):
+    """
+    Lazily parse "start-end" lines (bytes or str) into (start, end) pairs.
+
+    Blank lines before the first range are skipped and the first blank line
+    after it ends the section. When lines is an iterator it is left just
+    past that blank line, so the ingredients can be read from it next.
+    """
+    seen_range = False
+    for line in lines:
+        line = line.strip()
+        if not line:
+            if seen_range:
+                return
+            continue
+        if isinstance(line, str):
+            line = line.encode()
+        start, end = line.split(b'-')
+        seen_range = True
+        yield int(start), int(end)
+
+
+def scan_range_section(input_file):
+    """
+    Parse only the ranges section, with a bytes-level scan.
+
+    Returns (ranges, offset) where offset is where the ingredients start.
+    """
+    range_section, offset = read_range_section(input_file)
+    return list(iter_range_lines(range_section.splitlines())), offset
+
+
+def iter_ingredients(input_file, offset=None):
+    """
+    Lazily yield ingredient IDs one line at a time.
+
+    offset is the start of the ingredients section (from
+    scan_range_section); if omitted the ranges section is skipped first.
+    """
+    if offset is None:
+        _, offset = read_range_section(input_file)
+
+    with open(input_file, 'rb') as f:
+        f.seek(offset)
+        for line in f:
+            if line.strip():
+                yield int(line)
+
+
+def load_ingredients(input_file, offset=None):
+    """
+    Read the whole ingredients section at once into a compact array('q')
+    (a plain list if some ID does not fit in 64 bits).
+    """
+    if offset is None:
+        _, offset = read_range_section(input_file)
+
+    with open(input_file, 'rb') as f:
+        f.seek(offset)
+        ids = f.read().split()
+
+    try:
+        return array('q', map(int, ids))
+    except OverflowError:
+        return [int(i) for i in ids]  # IDs beyond 64 bits
+
+
 def is_fresh(ingredient_id, ranges):
     """Check if an ingredient ID falls into any fresh range."""
     for start, end in ranges:
@@ -96,29 +210,479 @@ def is_fresh_binary_search(ingredient_id, merged_ranges):
     return False
 
 
-def solve_part1(input_file):
-    """Count how many available ingredient IDs are fresh."""
-    ranges, ingredients = parse_input(input_file)
+def build_interval_index(merged_ranges):
+    """
+    Build a vectorized lookup index from merge_ranges output.
+
+    Starts and ends are kept as two sorted int64 arrays. If a bound does
+    not fit in 64 bits the arrays are left out and queries use bisect.
+    """
+    import numpy as np
+
+    index = {
+        'merged': merged_ranges,
+        'starts_list': [start for start, _ in merged_ranges],
+    }
+    try:
+        index['starts'] = np.array(index['starts_list'], dtype=np.int64)
+        index['ends'] = np.array([end for _, end in merged_ranges], dtype=np.int64)
+    except OverflowError:
+        pass
+    return index
+
+
+def is_fresh_bisect(ingredient_id, index):
+    """Scalar lookup on an interval index (used for IDs beyond 64 bits)."""
+    i = bisect_right(index['starts_list'], ingredient_id) - 1
+    return i >= 0 and ingredient_id <= index['merged'][i][1]
+
+
+def query_fresh(index, ingredient_ids):
+    """
+    Check a whole batch of ingredient IDs against an interval index.
+
+    One searchsorted finds, for every ID, the last range starting at or
+    before it; the ID is fresh if it is also <= that range's end.
+    Returns (mask, count). IDs beyond 64 bits fall back to bisect.
+    """
+    import numpy as np
+
+    ids = None
+    if 'starts' in index:
+        try:
+            ids = np.asarray(ingredient_ids, dtype=np.int64)
+        except OverflowError:
+            pass
+
+    if ids is None:
+        mask = np.array([is_fresh_bisect(i, index) for i in ingredient_ids], dtype=bool)
+        return mask, int(mask.sum())
+
+    pos = np.searchsorted(index['starts'], ids, side='right') - 1
+    ends = index['ends'][np.maximum(pos, 0)] if len(index['ends']) else np.zeros_like(ids)
+    mask = (pos >= 0) & (ids <= ends)
+    return mask, int(np.count_nonzero(mask))
+
+
+def solve_part1_numpy(input_file):
+    """Part 1 answered with one vectorized query over all ingredients."""
+    ranges, offset = scan_range_section(input_file)
+    index = build_interval_index(merge_ranges(ranges))
+    _, fresh_count = query_fresh(index, load_ingredients(input_file, offset))
+    return fresh_count
+
+
+INTERVAL_BLOCK_SIZE = 512  # Target ranges per block of an interval set
+
+
+def new_interval_set(ranges=()):
+    """
+    Create a mutable, always-merged set of fresh ranges.
+
+    The merged ranges are kept as a chunked sorted list: 'blocks' holds
+    (starts, ends) list pairs of at most 2 * INTERVAL_BLOCK_SIZE ranges each,
+    'firsts' holds the first start of every block, and 'covered' is a
+    running count of covered IDs, so the part 2 answer is always at hand.
+    Finding a range is two bisects (O(log n)), and a splice only shifts
+    elements within one bounded block, so add_range and remove_range cost
+    O(log n + INTERVAL_BLOCK_SIZE) plus O(n / INTERVAL_BLOCK_SIZE) list moves
+    when a block is split or dropped. Bulk loading goes through merge_ranges
+    once.
+    """
+    merged = merge_ranges(list(ranges))
+    blocks = []
+    for b in range(0, len(merged), INTERVAL_BLOCK_SIZE):
+        chunk = merged[b:b + INTERVAL_BLOCK_SIZE]
+        blocks.append(([start for start, _ in chunk], [end for _, end in chunk]))
+
+    return {
+        'blocks': blocks,
+        'firsts': [starts[0] for starts, _ in blocks],
+        'covered': sum(end - start + 1 for start, end in merged),
+    }
+
+
+def take_ranges(interval_set, lo, hi):
+    """
+    Remove and return, in order, every range of the set with end >= lo and
+    start <= hi. Each range is taken out at most once after being inserted,
+    so the walk over absorbed ranges is amortized O(1) per range.
+    """
+    blocks, firsts = interval_set['blocks'], interval_set['firsts']
+    if not blocks:
+        return []
+
+    # First range ending at or after lo: in the block holding lo, or the next one
+    b = max(bisect_right(firsts, lo) - 1, 0)
+    i = bisect_left(blocks[b][1], lo)
+    if i == len(blocks[b][1]) and b + 1 < len(blocks):
+        b, i = b + 1, 0
+
+    taken = []
+    c, j = b, i
+    while c < len(blocks):
+        starts, ends = blocks[c]
+        k = bisect_right(starts, hi, j)
+        taken.extend(zip(starts[j:k], ends[j:k]))
+        if k < len(starts):
+            break
+        c, j = c + 1, 0
+
+    if c == b:
+        del blocks[b][0][i:k], blocks[b][1][i:k]
+    else:
+        del blocks[b][0][i:], blocks[b][1][i:]
+        if c < len(blocks):
+            del blocks[c][0][:k], blocks[c][1][:k]
+        del blocks[b + 1:c], firsts[b + 1:c]
+
+    # Only blocks b and b + 1 changed: drop them if empty, merge if small
+    for d in (b + 1, b):
+        if d >= len(blocks):
+            continue
+        if not blocks[d][0]:
+            del blocks[d], firsts[d]
+            continue
+        firsts[d] = blocks[d][0][0]
+        if (d + 1 < len(blocks) and len(blocks[d][0]) < INTERVAL_BLOCK_SIZE // 2
+                and len(blocks[d][0]) + len(blocks[d + 1][0]) <= INTERVAL_BLOCK_SIZE):
+            blocks[d][0].extend(blocks[d + 1][0])
+            blocks[d][1].extend(blocks[d + 1][1])
+            del blocks[d + 1], firsts[d + 1]
+
+    return taken
+
+
+def insert_range(interval_set, start, end):
+    """
+    Insert [start, end], which must not overlap or touch any range of the
+    set, splitting its block in two once it holds 2 * INTERVAL_BLOCK_SIZE.
+    """
+    blocks, firsts = interval_set['blocks'], interval_set['firsts']
+    if not blocks:
+        blocks.append(([start], [end]))
+        firsts.append(start)
+        return
+
+    b = max(bisect_right(firsts, start) - 1, 0)
+    starts, ends = blocks[b]
+    i = bisect_left(starts, start)
+    starts.insert(i, start)
+    ends.insert(i, end)
+    firsts[b] = starts[0]
+
+    if len(starts) >= 2 * INTERVAL_BLOCK_SIZE:
+        blocks.insert(b + 1, (starts[INTERVAL_BLOCK_SIZE:], ends[INTERVAL_BLOCK_SIZE:]))
+        firsts.insert(b + 1, starts[INTERVAL_BLOCK_SIZE])
+        del starts[INTERVAL_BLOCK_SIZE:], ends[INTERVAL_BLOCK_SIZE:]
+
+
+def add_range(interval_set, start, end):
+    """Add [start, end], merging with every range it overlaps or touches."""
+    taken = take_ranges(interval_set, start - 1, end + 1)
+    if taken:
+        start = min(start, taken[0][0])
+        end = max(end, taken[-1][1])
+
+    insert_range(interval_set, start, end)
+    interval_set['covered'] += (end - start + 1) - sum(e - s + 1 for s, e in taken)
+
+
+def remove_range(interval_set, start, end):
+    """
+    Remove [start, end]. A range that sticks out on either side keeps the
+    part outside, so removing from the middle splits it in two.
+    """
+    taken = take_ranges(interval_set, start, end)
+    if not taken:
+        return
+
+    kept = []
+    if taken[0][0] < start:
+        kept.append((taken[0][0], start - 1))
+    if taken[-1][1] > end:
+        kept.append((end + 1, taken[-1][1]))
+
+    for kept_start, kept_end in kept:
+        insert_range(interval_set, kept_start, kept_end)
+    interval_set['covered'] -= sum(e - s + 1 for s, e in taken) - sum(e - s + 1 for s, e in kept)
+
+
+def contains(interval_set, ingredient_id):
+    """
+    Check if ingredient_id is fresh, in O(log n). Also accepts the flat
+    'starts'/'ends' dict returned by load_range_index.
+    """
+    if 'blocks' in interval_set:
+        b = bisect_right(interval_set['firsts'], ingredient_id) - 1
+        if b < 0:
+            return False
+        starts, ends = interval_set['blocks'][b]
+    else:
+        starts, ends = interval_set['starts'], interval_set['ends']
+
+    i = bisect_right(starts, ingredient_id) - 1
+    return i >= 0 and ingredient_id <= ends[i]
+
+
+def covered_count(interval_set):
+    """Total number of fresh IDs (the part 2 answer), in O(1)."""
+    return interval_set['covered']
+
+
+def count_fresh_sorted(merged_ranges, ingredient_ids):
+    """
+    Count fresh IDs by walking a sorted ID stream and the merged ranges
+    together with two pointers: O(n + m) time, constant extra memory.
+
+    ingredient_ids can be any iterable and is consumed lazily. If an ID
+    arrives out of order the walk can no longer move forward only, so the
+    rest of the stream falls back to binary search on the merged ranges.
+    """
+    fresh_count = 0
+    r = 0
+    previous = None
+    ids = iter(ingredient_ids)
+
+    for ingredient_id in ids:
+        if previous is not None and ingredient_id < previous:
+            # Unsorted input: switch to the indexed path for what is left
+            if is_fresh_binary_search(ingredient_id, merged_ranges):
+                fresh_count += 1
+            for rest_id in ids:
+                if is_fresh_binary_search(rest_id, merged_ranges):
+                    fresh_count += 1
+            return fresh_count
+        previous = ingredient_id
+
+        # Skip ranges that end before this ID
+        while r < len(merged_ranges) and merged_ranges[r][1] < ingredient_id:
+            r += 1
+        if r < len(merged_ranges) and merged_ranges[r][0] <= ingredient_id:
+            fresh_count += 1
+
+    return fresh_count
+
+
+def solve_part1_merge_join(source):
+    """
+    Part 1 with a streaming sort-merge join.
+
+    source is a path or an open file such as sys.stdin. The range section
+    is read and merged, then ingredient IDs are read one line at a time
+    and joined against the merged ranges with count_fresh_sorted.
+    """
+    if isinstance(source, (str, bytes, os.PathLike)):
+        with open(source, 'rb') as f:
+            return solve_part1_merge_join(f)
+
+    # Prefer the underlying binary stream (e.g. sys.stdin.buffer)
+    lines = iter(getattr(source, 'buffer', source))
+    ranges = list(iter_range_lines(lines))
+
+    ingredient_ids = (int(line) for line in lines if line.strip())
+    return count_fresh_sorted(merge_ranges(ranges), ingredient_ids)
+
+
+RANGE_RECORD = struct.Struct('<qq')  # One packed (start, end) pair
+
+
+def iter_packed_ranges(path, records_per_read=4096):
+    """Lazily read (start, end) pairs from a packed range file."""
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(RANGE_RECORD.size * records_per_read)
+            if not block:
+                return
+            yield from RANGE_RECORD.iter_unpack(block)
+
+
+def write_packed_ranges(path, ranges):
+    """Write (start, end) pairs as a packed range file."""
+    with open(path, 'wb') as f:
+        for start, end in ranges:
+            f.write(RANGE_RECORD.pack(start, end))
+
+
+def merge_ranges_external(input_file, output_file, buffer_size=1_000_000, work_dir=None):
+    """
+    Out-of-core version of merge_ranges for range lists larger than RAM.
+
+    1. Read at most buffer_size ranges at a time, sort them and write each
+       sorted run to a packed binary temp file
+    2. k-way merge the runs with heapq.merge, coalescing overlapping and
+       adjacent ranges on the fly
+    3. Write the merged ranges to output_file (packed binary)
+
+    Peak memory is one buffer of ranges during step 1 and one read block
+    per run during step 2. Returns the total number of covered IDs (the
+    solve_part2 answer).
+
+    The sorted runs go in work_dir, by default output_file's directory,
+    like the tile buffers of day 4's solve_tiled.
+    """
+    work_dir = work_dir or os.path.dirname(os.path.abspath(output_file))
+
+    with tempfile.TemporaryDirectory(dir=work_dir) as tmp:
+        runs = []
+        with open(input_file, 'rb') as f:
+            ranges = iter_range_lines(f)
+            while True:
+                buffer = list(itertools.islice(ranges, buffer_size))
+                if not buffer:
+                    break
+                buffer.sort()
+                run_path = os.path.join(tmp, f'run_{len(runs)}.bin')
+                write_packed_ranges(run_path, buffer)
+                runs.append(run_path)
+                del buffer
+
+        total_ids = 0
+        with open(output_file, 'wb') as out:
+            current = None
+            for start, end in heapq.merge(*(iter_packed_ranges(path) for path in runs)):
+                if current is not None and start <= current[1] + 1:
+                    current[1] = max(current[1], end)
+                    continue
+                if current is not None:
+                    out.write(RANGE_RECORD.pack(*current))
+                    total_ids += current[1] - current[0] + 1
+                current = [start, end]
+
+            if current is not None:
+                out.write(RANGE_RECORD.pack(*current))
+                total_ids += current[1] - current[0] + 1
+
+    return total_ids
+
+
+RANGE_INDEX_MAGIC = b'AOC5RIX1'
+RANGE_INDEX_HEADER = struct.Struct('<8s32sQQ')  # magic, sha256 of ranges, count, covered IDs
+
+
+def range_index_path(digest):
+    """Default merged-range index for a ranges section, keyed by its SHA-256 digest."""
+    return os.path.join(tempfile.gettempdir(), f"day5_ranges_{digest.hex()[:16]}.idx")
+
+
+def load_range_index(range_section, index_path=None):
+    """
+    Merged ranges for input_file, from a persistent on-disk index.
+
+    The index file is a header (magic, SHA-256 of the ranges section,
+    range count, covered-ID total) followed by the merged starts and ends
+    as two packed little-endian int64 arrays. If the stored hash matches
+    the current ranges section the file is memory-mapped and nothing is
+    parsed or merged; otherwise the ranges are merged and the index is
+    rewritten.
+
+    Returns a dict with 'starts', 'ends' (sorted sequences) and 'covered',
+    which contains() and covered_count() accept like an interval set.
+    """
+    digest = hashlib.sha256(range_section.strip()).digest()
+    index_path = index_path or range_index_path(digest)
+
+    try:
+        with open(index_path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        mapped = None  # Missing or empty index
+
+    if mapped is not None and len(mapped) >= RANGE_INDEX_HEADER.size:
+        magic, stored, count, covered = RANGE_INDEX_HEADER.unpack_from(mapped)
+        expected_size = RANGE_INDEX_HEADER.size + 16 * count
+        if (magic == RANGE_INDEX_MAGIC and stored == digest
+                and len(mapped) == expected_size and sys.byteorder == 'little'):
+            view = memoryview(mapped)[RANGE_INDEX_HEADER.size:]
+            return {
+                'starts': view[:8 * count].cast('q'),
+                'ends': view[8 * count:].cast('q'),
+                'covered': covered,
+                'mmap': mapped,
+            }
+
+    # Stale or missing: merge and rebuild
+    if mapped is not None:
+        mapped.close()
+
+    merged = merge_ranges(list(iter_range_lines(range_section.splitlines())))
+    covered = sum(end - start + 1 for start, end in merged)
+
+    try:
+        starts = array('q', [start for start, _ in merged])
+        ends = array('q', [end for _, end in merged])
+        header = RANGE_INDEX_HEADER.pack(RANGE_INDEX_MAGIC, digest, len(merged), covered)
+    except (OverflowError, struct.error):
+        # Bounds or total do not fit the packed format: answer without caching
+        return {
+            'starts': [start for start, _ in merged],
+            'ends': [end for _, end in merged],
+            'covered': covered,
+        }
+
+    try:
+        with open(index_path, 'wb') as f:
+            f.write(header)
+            for values in (starts, ends):
+                if sys.byteorder != 'little':
+                    values = array('q', values)
+                    values.byteswap()
+                f.write(values.tobytes())
+    except OSError:
+        pass  # Read-only location: still answer, just without caching
+
+    return {'starts': starts, 'ends': ends, 'covered': covered}
+
+
+def solve_part1(input_file, cache=False, index_path=None):
+    """
+    Count how many available ingredient IDs are fresh.
+
+    With cache=True the merged ranges come from the on-disk range index
+    (see load_range_index) instead of being parsed and merged again. The
+    index lives at index_path, by default in the temp directory.
+    """
+    if cache:
+        range_section, offset = read_range_section(input_file)
+        index = load_range_index(range_section, index_path)
+
+        fresh_count = 0
+        for ingredient_id in iter_ingredients(input_file, offset):
+            if contains(index, ingredient_id):
+                fresh_count += 1
+        return fresh_count
+
+    ranges, offset = scan_range_section(input_file)
 
     # Merge ranges for efficient lookup
     merged = merge_ranges(ranges)
 
     fresh_count = 0
-    for ingredient_id in ingredients:
+    for ingredient_id in iter_ingredients(input_file, offset):
         if is_fresh_binary_search(ingredient_id, merged):
             fresh_count += 1
 
     return fresh_count
 
 
-def solve_part2(input_file):
+def solve_part2(input_file, cache=False, index_path=None):
     """
     Count total number of unique IDs considered fresh by all ranges.
 
     After merging overlapping ranges, sum up the size of each range.
     Size of range (start, end) = end - start + 1 (inclusive)
+
+    Only the ranges section is read (plus at most one read block past the
+    blank line), however many ingredients follow.
+
+    With cache=True the total is read from the on-disk range index (see
+    solve_part1).
     """
-    ranges, _ = parse_input(input_file)
+    if cache:
+        range_section, _ = read_range_section(input_file)
+        return load_range_index(range_section, index_path)['covered']
+
+    ranges, _ = scan_range_section(input_file)
 
     # Merge ranges to eliminate overlaps
     merged = merge_ranges(ranges)
@@ -173,8 +737,6 @@ def verify_example():
 
 
 if __name__ == "__main__":
-    import os
-
     script_dir = os.path.dirname(os.path.abspath(__file__))
     input_file = os.path.join(script_dir, "inputs.txt")
 
@@ -187,5 +749,32 @@ if __name__ == "__main__":
 
     print("Day 5: Cafeteria")
     print("-" * 30)
+
+    if '-' in sys.argv:
+        # Stream the puzzle from stdin, e.g. `cat inputs.txt | python solution.py -`
+        print(f"Part 1 (merge join, stdin): {solve_part1_merge_join(sys.stdin)}")
+        sys.exit(0)
+
     print(f"Part 1: {solve_part1(input_file)}")
     print(f"Part 2: {solve_part2(input_file)}")
+
+    if '--numpy' in sys.argv:
+        print(f"Part 1 (NumPy): {solve_part1_numpy(input_file)}")
+
+    if '--cache' in sys.argv:
+        # Index path after the flag, e.g. `--cache ranges.idx`, else the temp directory
+        i = sys.argv.index('--cache') + 1
+        index_path = None
+        if i < len(sys.argv) and not sys.argv[i].startswith('-'):
+            index_path = sys.argv[i]
+        print(f"Part 1 (cached ranges): {solve_part1(input_file, cache=True, index_path=index_path)}")
+        print(f"Part 2 (cached ranges): {solve_part2(input_file, cache=True, index_path=index_path)}")
+
+    if '--external' in sys.argv:
+        # Output path after the flag, e.g. `--external merged.bin`, else the temp directory
+        i = sys.argv.index('--external') + 1
+        if i < len(sys.argv) and not sys.argv[i].startswith('-'):
+            merged_path = sys.argv[i]
+        else:
+            merged_path = os.path.join(tempfile.gettempdir(), "day5_merged_ranges.bin")
+        print(f"Part 2 (external merge): {merge_ranges_external(input_file, merged_path)}")